@@ -1,5 +1,8 @@
 #!/bin/bash
 
+# stop at the first failing step
+set -e
+
 # run all tests
 pytest tests
 # run all examples
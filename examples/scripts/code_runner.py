@@ -112,6 +112,7 @@ class CodeRunner:
         runtime_name: Runtime implementation name (default: "host_build_graph")
         device_id: Device ID (defaults to PTO_DEVICE_ID env var or 0)
         platform: Platform name ("a2a3" for hardware, "a2a3sim" for simulation, default: "a2a3")
+        verbose: Print per-component runtime build progress (default: False)
     """
 
     def __init__(
@@ -121,11 +122,13 @@ class CodeRunner:
         runtime_name: str = "host_build_graph",
         device_id: Optional[int] = None,
         platform: str = "a2a3",
+        verbose: bool = False,
     ):
         self.kernels_dir = Path(kernels_dir).resolve()
         self.golden_path = Path(golden_path).resolve()
         self.runtime_name = runtime_name
         self.platform = platform
+        self.verbose = verbose
         self.project_root = _get_project_root()
 
         # Resolve device ID
@@ -285,7 +288,9 @@ class CodeRunner:
 
         # Step 1: Build runtime
         print(f"\n=== Building Runtime: {self.runtime_name} (platform: {self.platform}) ===")
-        builder = RuntimeBuilder(runtime_root=self.project_root, platform=self.platform)
+        builder = RuntimeBuilder(
+            runtime_root=self.project_root, platform=self.platform, verbose=self.verbose
+        )
         pto_compiler = builder.get_pto_compiler()
         try:
             host_binary, aicpu_binary, aicore_binary = builder.build(self.runtime_name)
@@ -134,6 +134,7 @@ Golden.py interface:
             runtime_name=args.runtime,
             device_id=args.device,
             platform=args.platform,
+            verbose=args.verbose,
         )
 
         runner.run()
@@ -1,6 +1,9 @@
+import io
 import os
 import subprocess
+import sys
 import tempfile
+import threading
 from pathlib import Path
 from typing import List
 from toolchain import AICoreToolchain, AICPUToolchain, HostToolchain, HostSimToolchain
@@ -21,6 +24,8 @@ class BinaryCompiler:
     - "a2a3sim": all use host gcc/g++ (builds host-compatible .so files)
     """
     _instances = {}
+    # Serializes build logs so concurrent compile() calls don't interleave output
+    _log_lock = threading.Lock()
 
     def __new__(cls, platform: str = "a2a3"):
         if platform not in cls._instances:
@@ -135,11 +140,33 @@ class BinaryCompiler:
         )
         return result.returncode == 0
 
+    def get_toolchain(self, target_platform: str):
+        """
+        Return the toolchain used to build the specified target platform.
+
+        Args:
+            target_platform: Target platform ("aicore", "aicpu", or "host")
+
+        Raises:
+            ValueError: If target platform is invalid
+        """
+        if target_platform == "aicore":
+            return self.aicore_toolchain
+        elif target_platform == "aicpu":
+            return self.aicpu_toolchain
+        elif target_platform == "host":
+            return self.host_toolchain
+        raise ValueError(
+            f"Invalid target platform: {target_platform}. "
+            "Must be 'aicore', 'aicpu', or 'host'."
+        )
+
     def compile(
         self,
         target_platform: str,
         include_dirs: List[str],
         source_dirs: List[str],
+        verbose: bool = True,
     ) -> bytes:
         """
         Compile binary for the specified target platform.
@@ -148,6 +175,7 @@ class BinaryCompiler:
             target_platform: Target platform ("aicore", "aicpu", or "host")
             include_dirs: List of include directory paths
             source_dirs: List of source directory paths
+            verbose: Print the CMake/Make log (always printed on failure)
 
         Returns:
             Compiled binary data as bytes
@@ -157,24 +185,14 @@ class BinaryCompiler:
             RuntimeError: If CMake or Make fails
             FileNotFoundError: If output binary not found
         """
-        if target_platform == "aicore":
-            toolchain = self.aicore_toolchain
-        elif target_platform == "aicpu":
-            toolchain = self.aicpu_toolchain
-        elif target_platform == "host":
-            toolchain = self.host_toolchain
-        else:
-            raise ValueError(
-                f"Invalid target platform: {target_platform}. "
-                "Must be 'aicore', 'aicpu', or 'host'."
-            )
-
+        toolchain = self.get_toolchain(target_platform)
         cmake_args = toolchain.gen_cmake_args(include_dirs, source_dirs)
         cmake_source_dir = toolchain.get_root_dir()
         binary_name = toolchain.get_binary_name()
 
         return self._run_compilation(
-            cmake_source_dir, cmake_args, binary_name, platform=target_platform.upper()
+            cmake_source_dir, cmake_args, binary_name,
+            platform=target_platform.upper(), verbose=verbose,
         )
 
     def _run_compilation(
@@ -182,7 +200,8 @@ class BinaryCompiler:
         cmake_source_dir: str,
         cmake_args: str,
         binary_name: str,
-        platform: str = "AICore"
+        platform: str = "AICore",
+        verbose: bool = True,
     ) -> bytes:
         """
         Run CMake configuration and Make build in a temporary directory.
@@ -192,6 +211,7 @@ class BinaryCompiler:
             cmake_args: CMake command-line arguments string
             binary_name: Name of output binary
             platform: Platform name for logging
+            verbose: Print the CMake/Make log (always printed on failure)
 
         Returns:
             Compiled binary data as bytes
@@ -200,15 +220,38 @@ class BinaryCompiler:
             RuntimeError: If CMake or Make fails
             FileNotFoundError: If output binary not found
         """
+        log = io.StringIO()
+        succeeded = False
+        try:
+            binary_data = self._build_in_tempdir(
+                cmake_source_dir, cmake_args, binary_name, platform, log
+            )
+            succeeded = True
+            return binary_data
+        finally:
+            if verbose or not succeeded:
+                with BinaryCompiler._log_lock:
+                    sys.stdout.write(log.getvalue())
+                    sys.stdout.flush()
+
+    def _build_in_tempdir(
+        self,
+        cmake_source_dir: str,
+        cmake_args: str,
+        binary_name: str,
+        platform: str,
+        log: io.StringIO,
+    ) -> bytes:
+        """Configure and build in a fresh temporary directory, writing logs to log."""
         with tempfile.TemporaryDirectory(prefix=f"{platform.lower()}_build_", dir="/tmp") as build_dir:
             # Run CMake configuration
             cmake_cmd = ["cmake", cmake_source_dir] + cmake_args.split()
 
-            print(f"\n{'='*80}")
-            print(f"[{platform}] CMake Command:")
-            print(f"  Working directory: {build_dir}")
-            print(f"  Command: {' '.join(cmake_cmd)}")
-            print(f"{'='*80}\n")
+            print(f"\n{'='*80}", file=log)
+            print(f"[{platform}] CMake Command:", file=log)
+            print(f"  Working directory: {build_dir}", file=log)
+            print(f"  Command: {' '.join(cmake_cmd)}", file=log)
+            print(f"{'='*80}\n", file=log)
 
             try:
                 result = subprocess.run(
@@ -220,11 +263,11 @@ class BinaryCompiler:
                 )
 
                 if result.stdout:
-                    print(f"[{platform}] CMake stdout:")
-                    print(result.stdout)
+                    print(f"[{platform}] CMake stdout:", file=log)
+                    print(result.stdout, file=log)
                 if result.stderr:
-                    print(f"[{platform}] CMake stderr:")
-                    print(result.stderr)
+                    print(f"[{platform}] CMake stderr:", file=log)
+                    print(result.stderr, file=log)
 
                 if result.returncode != 0:
                     raise RuntimeError(
@@ -236,11 +279,11 @@ class BinaryCompiler:
             # Run Make to build
             make_cmd = ["make", "VERBOSE=1"]
 
-            print(f"\n{'='*80}")
-            print(f"[{platform}] Make Command:")
-            print(f"  Working directory: {build_dir}")
-            print(f"  Command: {' '.join(make_cmd)}")
-            print(f"{'='*80}\n")
+            print(f"\n{'='*80}", file=log)
+            print(f"[{platform}] Make Command:", file=log)
+            print(f"  Working directory: {build_dir}", file=log)
+            print(f"  Command: {' '.join(make_cmd)}", file=log)
+            print(f"{'='*80}\n", file=log)
 
             try:
                 result = subprocess.run(
@@ -252,11 +295,11 @@ class BinaryCompiler:
                 )
 
                 if result.stdout:
-                    print(f"[{platform}] Make stdout:")
-                    print(result.stdout)
+                    print(f"[{platform}] Make stdout:", file=log)
+                    print(result.stdout, file=log)
                 if result.stderr:
-                    print(f"[{platform}] Make stderr:")
-                    print(result.stderr)
+                    print(f"[{platform}] Make stderr:", file=log)
+                    print(result.stderr, file=log)
 
                 if result.returncode != 0:
                     raise RuntimeError(
@@ -1,4 +1,9 @@
+import hashlib
 import importlib.util
+import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -15,27 +20,54 @@ class RuntimeBuilder:
     be compiled for any platform (e.g., a2a3, a2a3sim).
     """
 
-    def __init__(self, platform: str = "a2a3", runtime_root: Optional[Path] = None):
+    def __init__(
+        self,
+        platform: str = "a2a3",
+        runtime_root: Optional[Path] = None,
+        cache_dir: Optional[Path] = None,
+        verbose: bool = False,
+    ):
         """
         Initialize RuntimeBuilder with platform selection.
 
         Args:
             platform: Target platform ("a2a3" or "a2a3sim")
             runtime_root: Root directory of the project. Defaults to parent of python/.
+            cache_dir: Directory for persisting built binaries across processes.
+                Defaults to PTO_BUILD_CACHE_DIR env var; disk caching is
+                disabled when neither is set.
+            verbose: Print per-component progress and CMake/Make logs during
+                build(). Logs of a failing component are printed regardless.
         """
         self.platform = platform
+        self.verbose = verbose
 
         if runtime_root is None:
             runtime_root = Path(__file__).parent.parent
         self.runtime_root = runtime_root
         self.runtime_dir = runtime_root / "src" / "runtime"
+        self.platform_root = runtime_root / "src" / "platform"
+
+        if cache_dir is None and os.environ.get("PTO_BUILD_CACHE_DIR"):
+            cache_dir = Path(os.environ["PTO_BUILD_CACHE_DIR"])
+        self.cache_dir = cache_dir
+
+        # (name, platform, source signature) -> (host, aicpu, aicore) binaries
+        self._build_cache = {}
+        # build_config.py path -> (mtime_ns, BUILD_CONFIG)
+        self._config_cache = {}
 
         # Discover available runtime implementations
         self._runtimes = {}
         if self.runtime_dir.is_dir():
-            for entry in sorted(self.runtime_dir.iterdir()):
-                config_path = entry / "build_config.py"
-                if entry.is_dir() and config_path.is_file():
+            # scandir exposes the entry type without an extra stat() per entry
+            with os.scandir(self.runtime_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                config_path = self.runtime_dir / entry.name / "build_config.py"
+                if config_path.is_file():
                     self._runtimes[entry.name] = config_path
 
         # Create platform-configured compilers
@@ -74,36 +106,154 @@ class RuntimeBuilder:
             )
 
         config_path = self._runtimes[name]
-        config_dir = config_path.parent
+        # Resolve the root once; entries only need lexical normalization below
+        config_dir = config_path.parent.resolve()
+
+        build_config = self._load_build_config(config_path)
+
+        # Resolve all include/source dirs up front so the cache can be checked
+        resolved = {}
+        for kind in ("aicore", "aicpu", "host"):
+            cfg = build_config[kind]
+            resolved[kind] = (
+                [os.path.normpath(config_dir / p) for p in cfg["include_dirs"]],
+                [os.path.normpath(config_dir / p) for p in cfg["source_dirs"]],
+            )
+
+        compiler = self._binary_compiler
+
+        # The cache key covers every build input: runtime sources, all of
+        # src/platform/ (host CMake pulls in src/platform/include/), the
+        # python toolchain code, and the cmake invocation of each component
+        python_dir = Path(__file__).parent
+        watched = [
+            str(config_path),
+            str(self.platform_root),
+            str(python_dir / "toolchain.py"),
+            str(python_dir / "binary_compiler.py"),
+        ]
+        toolchain_config = []
+        for kind, (include_dirs, source_dirs) in resolved.items():
+            watched.extend(include_dirs)
+            watched.extend(source_dirs)
+            toolchain = compiler.get_toolchain(kind)
+            toolchain_config.append(
+                (kind, toolchain.get_root_dir(), toolchain.gen_cmake_args(include_dirs, source_dirs))
+            )
+        key = (name, self.platform, self._source_signature(watched, toolchain_config))
+
+        cached = self._build_cache.get(key) or self._load_disk_cache(key)
+        if cached is not None:
+            print(f"\nUsing cached build of '{name}' (platform: {self.platform})")
+            self._build_cache[key] = cached
+            return cached
+
+        # Compile AICore, AICPU and Host concurrently; each compile() runs
+        # cmake/make in its own temporary build directory, and its log is
+        # tagged with the component name ([AICORE], [AICPU], [HOST])
+        if self.verbose:
+            print("\nCompiling AICore, AICPU and Host concurrently...")
+        with ThreadPoolExecutor(max_workers=len(resolved)) as executor:
+            futures = {}
+            for kind, (include_dirs, source_dirs) in resolved.items():
+                futures[kind] = executor.submit(
+                    compiler.compile, kind, include_dirs, source_dirs, verbose=self.verbose
+                )
+            results = {kind: future.result() for kind, future in futures.items()}
+
+        print("\nBuild complete!")
+        binaries = (results["host"], results["aicpu"], results["aicore"])
+        self._build_cache[key] = binaries
+        self._store_disk_cache(key, binaries)
+        return binaries
+
+    def _load_build_config(self, config_path: Path) -> dict:
+        """Load BUILD_CONFIG from build_config.py, re-executing it only when it changes."""
+        mtime = config_path.stat().st_mtime_ns
+        cached = self._config_cache.get(config_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
 
-        # Load build_config.py
         spec = importlib.util.spec_from_file_location("build_config", config_path)
         build_config_module = importlib.util.module_from_spec(spec)
         spec.loader.exec_module(build_config_module)
         build_config = build_config_module.BUILD_CONFIG
+        self._config_cache[config_path] = (mtime, build_config)
+        return build_config
 
-        compiler = self._binary_compiler
+    @staticmethod
+    def _source_signature(paths: list, toolchain_config: list) -> str:
+        """
+        Compute a signature over every file under the given paths.
 
-        # Compile AICore kernel
-        print("\n[1/3] Compiling AICore kernel...")
-        aicore_cfg = build_config["aicore"]
-        aicore_include_dirs = [str((config_dir / p).resolve()) for p in aicore_cfg["include_dirs"]]
-        aicore_source_dirs = [str((config_dir / p).resolve()) for p in aicore_cfg["source_dirs"]]
-        aicore_binary = compiler.compile("aicore", aicore_include_dirs, aicore_source_dirs)
-
-        # Compile AICPU kernel
-        print("\n[2/3] Compiling AICPU kernel...")
-        aicpu_cfg = build_config["aicpu"]
-        aicpu_include_dirs = [str((config_dir / p).resolve()) for p in aicpu_cfg["include_dirs"]]
-        aicpu_source_dirs = [str((config_dir / p).resolve()) for p in aicpu_cfg["source_dirs"]]
-        aicpu_binary = compiler.compile("aicpu", aicpu_include_dirs, aicpu_source_dirs)
-
-        # Compile Host runtime
-        print("\n[3/3] Compiling Host runtime...")
-        host_cfg = build_config["host"]
-        host_include_dirs = [str((config_dir / p).resolve()) for p in host_cfg["include_dirs"]]
-        host_source_dirs = [str((config_dir / p).resolve()) for p in host_cfg["source_dirs"]]
-        host_binary = compiler.compile("host", host_include_dirs, host_source_dirs)
+        Hashes (path, size, mtime) of each file so that edits, additions
+        and removals all invalidate the signature, together with the
+        per-component toolchain configuration. Files that cannot be stat'ed
+        (dangling symlinks, files removed mid-walk) are recorded by path
+        only instead of failing the build.
+        """
+        def file_entry(file_path: str) -> tuple:
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                return (file_path, -1, -1)
+            return (file_path, st.st_size, st.st_mtime_ns)
 
-        print("\nBuild complete!")
-        return (host_binary, aicpu_binary, aicore_binary)
+        entries = set()
+        # Components share dirs (e.g. "runtime" is both include and source
+        # for every kind), so walk each root only once
+        for root in sorted(set(paths)):
+            if os.path.isfile(root):
+                entries.add(file_entry(root))
+                continue
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+                for filename in filenames:
+                    entries.add(file_entry(os.path.join(dirpath, filename)))
+
+        digest = hashlib.sha256()
+        for config in toolchain_config:
+            digest.update(repr(config).encode())
+        for entry in sorted(entries):
+            digest.update(repr(entry).encode())
+        return digest.hexdigest()
+
+    def _cache_file(self, name: str) -> Optional[Path]:
+        """Return the on-disk cache file for a runtime, or None if disabled."""
+        if self.cache_dir is None:
+            return None
+        return Path(self.cache_dir) / f"{name}-{self.platform}.pkl"
+
+    def _load_disk_cache(self, key: tuple) -> Optional[tuple]:
+        """Load binaries from the disk cache if the stored signature matches."""
+        cache_file = self._cache_file(key[0])
+        if cache_file is None or not cache_file.is_file():
+            return None
+        try:
+            with open(cache_file, "rb") as f:
+                stored_key, binaries = pickle.load(f)
+        except Exception:
+            return None
+        return binaries if stored_key == key else None
+
+    def _store_disk_cache(self, key: tuple, binaries: tuple) -> None:
+        """
+        Persist binaries to the disk cache, replacing the file atomically.
+
+        Best-effort: a read-only or full cache directory only skips the
+        store, it never fails a build that already succeeded.
+        """
+        cache_file = self._cache_file(key[0])
+        if cache_file is None:
+            return
+        tmp_path = None
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, binaries), f)
+            os.replace(tmp_path, cache_file)
+        except OSError as e:
+            print(f"Warning: could not write build cache {cache_file}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
@@ -0,0 +1,66 @@
+"""Tests for BinaryCompiler build logging."""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+# Add python/ to path so we can import binary_compiler
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / "python"))
+
+
+@pytest.fixture
+def compiler():
+    """A2A3sim BinaryCompiler that doesn't require gcc/g++ on PATH."""
+    from binary_compiler import BinaryCompiler
+
+    BinaryCompiler._instances.clear()
+    with patch.object(BinaryCompiler, "_ensure_host_compilers"):
+        yield BinaryCompiler(platform="a2a3sim")
+    BinaryCompiler._instances.clear()
+
+
+def _fake_run(make_returncode=0):
+    """Build a subprocess.run replacement for the cmake/make steps."""
+    def run(cmd, cwd=None, **kwargs):
+        if cmd[0] == "make":
+            if make_returncode == 0:
+                with open(os.path.join(cwd, "libhost_runtime.so"), "wb") as f:
+                    f.write(b"host_bin")
+            return MagicMock(returncode=make_returncode, stdout="make output", stderr="make error")
+        return MagicMock(returncode=0, stdout="cmake output", stderr="")
+    return run
+
+
+class TestBinaryCompilerLogging:
+    """Test that compile() logs follow the verbose flag and always show on failure."""
+
+    def test_quiet_on_success(self, compiler, capsys):
+        """verbose=False suppresses the CMake/Make log of a successful build."""
+        with patch("binary_compiler.subprocess.run", side_effect=_fake_run()):
+            binary = compiler.compile("host", ["/inc"], ["/src"], verbose=False)
+
+        assert binary == b"host_bin"
+        assert capsys.readouterr().out == ""
+
+    def test_verbose_on_success(self, compiler, capsys):
+        """verbose=True prints the CMake/Make log of a successful build."""
+        with patch("binary_compiler.subprocess.run", side_effect=_fake_run()):
+            compiler.compile("host", ["/inc"], ["/src"], verbose=True)
+
+        out = capsys.readouterr().out
+        assert "[HOST] CMake Command:" in out
+        assert "make output" in out
+
+    def test_log_printed_on_failure_even_when_quiet(self, compiler, capsys):
+        """A failing build prints its log regardless of verbose."""
+        with patch("binary_compiler.subprocess.run", side_effect=_fake_run(make_returncode=2)):
+            with pytest.raises(RuntimeError, match="Make build failed for HOST"):
+                compiler.compile("host", ["/inc"], ["/src"], verbose=False)
+
+        out = capsys.readouterr().out
+        assert "[HOST] Make Command:" in out
+        assert "make error" in out
@@ -13,6 +13,12 @@ PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT / "python"))
 
 
+@pytest.fixture(autouse=True)
+def _isolate_build_cache(monkeypatch):
+    """Keep a user's PTO_BUILD_CACHE_DIR out of the tests; disk caching is opt-in per test."""
+    monkeypatch.delenv("PTO_BUILD_CACHE_DIR", raising=False)
+
+
 # --- Discovery tests (no compilation needed) ---
 
 
@@ -181,11 +187,8 @@ class TestRuntimeBuilderBuild:
         self._make_runtime(tmp_path)
 
         mock_instance = MockCompiler.return_value
-        mock_instance.compile.side_effect = [
-            b"aicore_bin",   # first call: aicore
-            b"aicpu_bin",    # second call: aicpu
-            b"host_bin",     # third call: host
-        ]
+        # Components compile concurrently, so key the result on target platform
+        mock_instance.compile.side_effect = lambda target, *_, **__: f"{target}_bin".encode()
 
         builder = RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path)
         result = builder.build("test_rt")
@@ -207,7 +210,7 @@ class TestRuntimeBuilderBuild:
         builder.build("test_rt")
 
         assert mock_instance.compile.call_count == 3
-        platforms = [call.args[0] for call in mock_instance.compile.call_args_list]
+        platforms = sorted(call.args[0] for call in mock_instance.compile.call_args_list)
         assert platforms == ["aicore", "aicpu", "host"]
 
     @patch("runtime_builder.PTOCompiler")
@@ -224,8 +227,10 @@ class TestRuntimeBuilderBuild:
         builder = RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path)
         builder.build("test_rt")
 
-        # Check the first call (aicore): include_dirs should be resolved paths
-        aicore_call = mock_instance.compile.call_args_list[0]
+        # Check the aicore call: include_dirs should be resolved paths
+        aicore_call = next(
+            call for call in mock_instance.compile.call_args_list if call.args[0] == "aicore"
+        )
         include_dirs = aicore_call.args[1]
         for d in include_dirs:
             assert Path(d).is_absolute()
@@ -246,6 +251,179 @@ class TestRuntimeBuilderBuild:
         with pytest.raises(RuntimeError, match="cmake failed"):
             builder.build("test_rt")
 
+    @patch("runtime_builder.PTOCompiler")
+    @patch("runtime_builder.BinaryCompiler")
+    def test_build_progress_only_when_verbose(self, MockCompiler, MockPTO, tmp_path, capsys):
+        """Per-component progress lines are printed only with verbose=True."""
+        from runtime_builder import RuntimeBuilder
+
+        self._make_runtime(tmp_path)
+        MockCompiler.return_value.compile.return_value = b"binary"
+
+        RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path).build("test_rt")
+        quiet = capsys.readouterr().out
+        assert "Compiling AICore, AICPU and Host" not in quiet
+        assert "Build complete!" in quiet
+
+        RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path, verbose=True).build("test_rt")
+        assert "Compiling AICore, AICPU and Host concurrently..." in capsys.readouterr().out
+
+        verbose_flags = [call.kwargs["verbose"] for call in MockCompiler.return_value.compile.call_args_list]
+        assert verbose_flags == [False] * 3 + [True] * 3
+
+    @patch("runtime_builder.PTOCompiler")
+    @patch("runtime_builder.BinaryCompiler")
+    def test_repeated_build_compiles_once(self, MockCompiler, MockPTO, tmp_path):
+        """A second build() of an unchanged runtime returns cached binaries."""
+        from runtime_builder import RuntimeBuilder
+
+        self._make_runtime(tmp_path)
+
+        mock_instance = MockCompiler.return_value
+        mock_instance.compile.return_value = b"binary"
+
+        builder = RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path)
+        first = builder.build("test_rt")
+        second = builder.build("test_rt")
+
+        assert first == second
+        assert mock_instance.compile.call_count == 3
+
+    @patch("runtime_builder.PTOCompiler")
+    @patch("runtime_builder.BinaryCompiler")
+    def test_source_change_invalidates_cache(self, MockCompiler, MockPTO, tmp_path):
+        """Adding a source file forces a rebuild."""
+        from runtime_builder import RuntimeBuilder
+
+        rt_dir = self._make_runtime(tmp_path)
+
+        mock_instance = MockCompiler.return_value
+        mock_instance.compile.return_value = b"binary"
+
+        builder = RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path)
+        builder.build("test_rt")
+        (rt_dir / "host" / "new_file.cpp").write_text("// new\n")
+        builder.build("test_rt")
+
+        assert mock_instance.compile.call_count == 6
+
+    @patch("runtime_builder.PTOCompiler")
+    @patch("runtime_builder.BinaryCompiler")
+    def test_build_tolerates_dangling_symlink(self, MockCompiler, MockPTO, tmp_path):
+        """A dangling symlink in a watched dir does not break build() or its cache."""
+        from runtime_builder import RuntimeBuilder
+
+        rt_dir = self._make_runtime(tmp_path)
+        (rt_dir / "runtime" / "stale.h").symlink_to(tmp_path / "missing.h")
+
+        mock_instance = MockCompiler.return_value
+        mock_instance.compile.return_value = b"binary"
+
+        builder = RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path)
+        builder.build("test_rt")
+        builder.build("test_rt")
+
+        assert mock_instance.compile.call_count == 3
+
+    @patch("runtime_builder.PTOCompiler")
+    @patch("runtime_builder.BinaryCompiler")
+    def test_platform_include_change_invalidates_cache(self, MockCompiler, MockPTO, tmp_path):
+        """Editing a shared header under src/platform/include forces a rebuild."""
+        from runtime_builder import RuntimeBuilder
+
+        self._make_runtime(tmp_path)
+        header = tmp_path / "src" / "platform" / "include" / "host" / "pto_runtime_c_api.h"
+        header.parent.mkdir(parents=True)
+        header.write_text("// v1\n")
+
+        mock_instance = MockCompiler.return_value
+        mock_instance.compile.return_value = b"binary"
+
+        builder = RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path)
+        builder.build("test_rt")
+        header.write_text("// version 2\n")
+        builder.build("test_rt")
+
+        assert mock_instance.compile.call_count == 6
+
+    @patch("runtime_builder.PTOCompiler")
+    @patch("runtime_builder.BinaryCompiler")
+    def test_toolchain_change_invalidates_cache(self, MockCompiler, MockPTO, tmp_path):
+        """A different cmake invocation for any component forces a rebuild."""
+        from runtime_builder import RuntimeBuilder
+
+        self._make_runtime(tmp_path)
+
+        mock_instance = MockCompiler.return_value
+        mock_instance.compile.return_value = b"binary"
+        toolchain = mock_instance.get_toolchain.return_value
+        toolchain.get_root_dir.return_value = "/cmake/root"
+        toolchain.gen_cmake_args.return_value = "-DCMAKE_CXX_COMPILER=g++"
+
+        builder = RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path)
+        builder.build("test_rt")
+        toolchain.gen_cmake_args.return_value = "-DCMAKE_CXX_COMPILER=clang++"
+        builder.build("test_rt")
+
+        assert mock_instance.compile.call_count == 6
+
+    @patch("runtime_builder.PTOCompiler")
+    @patch("runtime_builder.BinaryCompiler")
+    def test_disk_cache_write_failure_does_not_fail_build(self, MockCompiler, MockPTO, tmp_path):
+        """An unwritable cache_dir still returns the freshly built binaries."""
+        from runtime_builder import RuntimeBuilder
+
+        self._make_runtime(tmp_path)
+        # A regular file where the cache directory should be makes mkdir() fail
+        cache_dir = tmp_path / "not_a_dir"
+        cache_dir.write_text("")
+
+        mock_instance = MockCompiler.return_value
+        mock_instance.compile.side_effect = lambda target, *_, **__: f"{target}_bin".encode()
+
+        builder = RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path, cache_dir=cache_dir)
+        result = builder.build("test_rt")
+
+        assert result == (b"host_bin", b"aicpu_bin", b"aicore_bin")
+
+    @patch("runtime_builder.PTOCompiler")
+    @patch("runtime_builder.BinaryCompiler")
+    def test_build_config_loaded_once_while_unchanged(self, MockCompiler, MockPTO, tmp_path):
+        """build_config.py is executed again only after it is modified."""
+        from runtime_builder import RuntimeBuilder
+
+        rt_dir = self._make_runtime(tmp_path)
+        config_path = rt_dir / "build_config.py"
+
+        builder = RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path)
+        first = builder._load_build_config(config_path)
+        assert builder._load_build_config(config_path) is first
+
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert builder._load_build_config(config_path) is not first
+
+    @patch("runtime_builder.PTOCompiler")
+    @patch("runtime_builder.BinaryCompiler")
+    def test_disk_cache_shared_across_instances(self, MockCompiler, MockPTO, tmp_path):
+        """With cache_dir set, a fresh builder reuses binaries from disk."""
+        from runtime_builder import RuntimeBuilder
+
+        self._make_runtime(tmp_path)
+        cache_dir = tmp_path / "cache"
+
+        mock_instance = MockCompiler.return_value
+        mock_instance.compile.side_effect = lambda target, *_, **__: f"{target}_bin".encode()
+
+        RuntimeBuilder(platform="a2a3sim", runtime_root=tmp_path, cache_dir=cache_dir).build("test_rt")
+        result = RuntimeBuilder(
+            platform="a2a3sim", runtime_root=tmp_path, cache_dir=cache_dir
+        ).build("test_rt")
+
+        assert result == (b"host_bin", b"aicpu_bin", b"aicore_bin")
+        assert mock_instance.compile.call_count == 3
+        assert (cache_dir / "test_rt-a2a3sim.pkl").is_file()
+
 
 # --- Full integration tests (real compilation) ---
 